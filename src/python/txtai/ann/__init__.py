@@ -2,8 +2,50 @@
 ANN imports
 """
 
-from .annoy import Annoy
+from importlib import import_module as _importmodule
+from typing import TYPE_CHECKING
+
 from .base import ANN
 from .factory import ANNFactory
-from .faiss import Faiss
-from .hnsw import HNSW
+
+# Backends are loaded on first access so only the backends in use are imported
+if TYPE_CHECKING:
+    from .annoy import Annoy
+    from .faiss import Faiss
+    from .hnsw import HNSW
+
+__all__ = ["ANN", "ANNFactory", "Annoy", "Faiss", "HNSW"]
+
+_BACKENDS = {"Annoy": ".annoy", "Faiss": ".faiss", "HNSW": ".hnsw"}
+
+
+def __getattr__(name):
+    """
+    Lazily imports ANN backends on first access.
+
+    Args:
+        name: attribute name
+
+    Returns:
+        attribute value
+    """
+
+    if name not in _BACKENDS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Import module, cache resolved attribute on this module
+    value = getattr(_importmodule(_BACKENDS[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    """
+    Lists module attributes including lazily loaded attributes.
+
+    Returns:
+        list of attribute names
+    """
+
+    return sorted(set(globals()) | set(__all__))
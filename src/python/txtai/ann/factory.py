@@ -2,9 +2,7 @@
 Factory module
 """
 
-from .annoy import Annoy, ANNOY
-from .faiss import Faiss
-from .hnsw import HNSW, HNSWLIB
+import importlib
 
 
 class ANNFactory:
@@ -30,19 +28,35 @@ class ANNFactory:
 
         # Create ANN instance
         if backend == "annoy":
-            if not ANNOY:
+            annoy = ANNFactory.module("annoy")
+            if not annoy.ANNOY:
                 raise ImportError('annoy library is not available - install "similarity" extra to enable')
 
-            model = Annoy(config)
+            model = annoy.Annoy(config)
         elif backend == "hnsw":
-            if not HNSWLIB:
+            hnsw = ANNFactory.module("hnsw")
+            if not hnsw.HNSWLIB:
                 raise ImportError('hnswlib library is not available - install "similarity" extra to enable')
 
-            model = HNSW(config)
+            model = hnsw.HNSW(config)
         else:
-            model = Faiss(config)
+            model = ANNFactory.module("faiss").Faiss(config)
 
         # Store config back
         config["backend"] = backend
 
         return model
+
+    @staticmethod
+    def module(backend):
+        """
+        Imports an ANN backend module. Backends are imported on demand so only the backend in use is loaded.
+
+        Args:
+            backend: backend module name
+
+        Returns:
+            backend module
+        """
+
+        return importlib.import_module(f".{backend}", __package__)
@@ -94,7 +94,7 @@ class Models:
         return "cpu" if deviceid < 0 else f"cuda:{deviceid}"
 
     @staticmethod
-    def load(path, config=None, task="default"):
+    def load(path, config=None, task="default", **kwargs):
         """
         Loads a machine learning model. Handles multiple model frameworks (ONNX, Transformers).
 
@@ -102,6 +102,7 @@ class Models:
             path: path to model
             config: path to model configuration
             task: task name used to lookup model type
+            kwargs: additional keyword arguments passed to Transformers model load methods
 
         Returns:
             machine learning model
@@ -125,4 +126,4 @@ class Models:
         }
 
         # Load model for supported tasks. Return path for unsupported tasks.
-        return models[task](path) if task in models else path
+        return models[task](path, **kwargs) if task in models else path
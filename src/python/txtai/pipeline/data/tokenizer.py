@@ -20,6 +20,9 @@ class Tokenizer(Pipeline):
                   "they", "this", "to", "was", "will", "with"}
     # fmt: on
 
+    # Valid token pattern, compiled once and shared across calls
+    PATTERN = re.compile(r"^\d*[a-z][\-.0-9:_a-z]{1,}$")
+
     @staticmethod
     def tokenize(text):
         """
@@ -51,4 +54,4 @@ class Tokenizer(Pipeline):
         # Tokenize on alphanumeric strings.
         # Require strings to be at least 2 characters long.
         # Require at least 1 non-trailing alpha character in string.
-        return [token for token in tokens if re.match(r"^\d*[a-z][\-.0-9:_a-z]{1,}$", token) and token not in Tokenizer.STOP_WORDS]
+        return [token for token in tokens if Tokenizer.PATTERN.match(token) and token not in Tokenizer.STOP_WORDS]
@@ -2,8 +2,18 @@
 Hugging Face Transformers pipeline wrapper module
 """
 
+import os
+
 from transformers import pipeline
 
+# Conditional import
+try:
+    from transformers import BitsAndBytesConfig
+
+    BITSANDBYTES = True
+except ImportError:
+    BITSANDBYTES = False
+
 from ..models import Models
 from .tensors import Tensors
 
@@ -22,7 +32,9 @@ class HFPipeline(Tensors):
             task: pipeline task or category
             path: optional path to model, accepts Hugging Face model hub id, local path or (model, tokenizer) tuple.
                   uses default model for task if not provided
-            quantize: if model should be quantized, defaults to False
+            quantize: if model should be quantized, defaults to False. Also accepts a dict of BitsAndBytesConfig options,
+                      for example {"load_in_8bit": True, "llm_int8_threshold": 6.0}. These options are applied at model
+                      load time on GPU. CPU models fall back to dynamic quantization.
             gpu: True/False if GPU should be enabled, also supports a GPU device id
             model: optional existing pipeline model to wrap
         """
@@ -34,14 +46,32 @@ class HFPipeline(Tensors):
             # Get device id
             deviceid = Models.deviceid(gpu)
 
+            # Quantization options applied at model load time, only supported on GPU
+            kwargs, device = {}, deviceid
+            if isinstance(quantize, dict) and deviceid != -1:
+                if not BITSANDBYTES:
+                    raise ImportError("BitsAndBytesConfig is not available - upgrade transformers to enable")
+
+                # Quantized models are placed on the device when loaded
+                kwargs, device = {"quantization_config": BitsAndBytesConfig(**quantize), "device_map": {"": deviceid}}, None
+
             # Transformer pipeline task
             if isinstance(path, (list, tuple)):
                 # Derive configuration, if possible
                 config = path[1] if path[1] and isinstance(path[1], str) else None
 
-                self.pipeline = pipeline(task, model=Models.load(path[0], config, task), tokenizer=path[1], device=deviceid)
+                # Quantization options only apply to models loaded from a model hub id or local directory
+                if kwargs and (not isinstance(path[0], str) or os.path.isfile(path[0])):
+                    raise ValueError("Quantization options require a model path - already loaded and ONNX models are not supported")
+
+                # Models.load returns the path for tasks it doesn't load, the pipeline loads these models
+                model = Models.load(path[0], config, task, **kwargs)
+                args = {"model_kwargs": kwargs} if kwargs and isinstance(model, str) else {}
+
+                self.pipeline = pipeline(task, model=model, tokenizer=path[1], device=device, **args)
             else:
-                self.pipeline = pipeline(task, model=path, tokenizer=path, device=deviceid)
+                args = {"model_kwargs": kwargs} if kwargs else {}
+                self.pipeline = pipeline(task, model=path, tokenizer=path, device=device, **args)
 
             # Model quantization. Compresses model to int8 precision, improves runtime performance. Only supported on CPU.
             if deviceid == -1 and quantize:
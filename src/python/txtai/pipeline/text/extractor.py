@@ -2,6 +2,9 @@
 Extractor module
 """
 
+import heapq
+import operator
+
 from ..base import Pipeline
 from ..data import Tokenizer
 
@@ -21,7 +24,8 @@ class Extractor(Pipeline):
         Args:
             similarity: similarity instance (embeddings or similarity instance)
             path: path to qa model
-            quantize: True if model should be quantized before inference, False otherwise.
+            quantize: True if model should be quantized before inference, False otherwise. Also accepts a dict of
+                      BitsAndBytesConfig options for GPU models (e.g. {"load_in_8bit": True, "llm_int8_threshold": 6.0}).
             gpu: if gpu inference should be used (only works if GPUs are available)
             model: optional existing pipeline model to wrap
             tokenizer: Tokenizer class
@@ -48,6 +52,32 @@ class Extractor(Pipeline):
         # Top N context matches to include for question-answering
         self.context = context if context else 3
 
+    @property
+    def similarity(self):
+        """
+        Similarity instance used to build question context.
+
+        Returns:
+            similarity instance (embeddings or similarity instance)
+        """
+
+        return self._similarity
+
+    @similarity.setter
+    def similarity(self, similarity):
+        """
+        Sets the similarity instance. Similarity capabilities are resolved once here, since the
+        similarity instance can be set after the extractor is created.
+
+        Args:
+            similarity: similarity instance (embeddings or similarity instance)
+        """
+
+        self._similarity = similarity
+
+        # True if similarity is a Similarity pipeline, otherwise assume this is an embeddings instance
+        self._pipelinesimilarity = isinstance(similarity, Similarity)
+
     def __call__(self, queue, texts):
         """
         Extracts answers to input questions. This method runs queries against a list of text, finds the top n best matches
@@ -62,21 +92,23 @@ class Extractor(Pipeline):
             list of (name, answer)
         """
 
+        if not queue:
+            return []
+
+        # Split queue into columns
+        names, queries, questions, snippets = (list(column) for column in zip(*queue))
+
         # Execute embeddings query
-        results = self.query([query for _, query, _, _ in queue], texts)
+        results = self.query(queries, texts)
 
-        # Build question-context pairs
-        names, questions, contexts, topns, snippets = [], [], [], [], []
-        for x, (name, _, question, snippet) in enumerate(queue):
-            # Build context using top n best matching segments
-            topn = sorted(results[x], key=lambda y: y[2], reverse=True)[: self.context]
-            context = " ".join([text for _, text, _ in sorted(topn, key=lambda y: y[0])])
-
-            names.append(name)
-            questions.append(question)
-            contexts.append(context)
-            topns.append([text for _, text, _ in topn])
-            snippets.append(snippet)
+        # Build context using top n best matching segments
+        context, score = self.context, operator.itemgetter(2)
+        topns = [heapq.nlargest(context, result, key=score) for result in results]
+
+        # Join context text, restore original text ordering when there are multiple matches
+        index, text = operator.itemgetter(0), operator.itemgetter(1)
+        contexts = [" ".join(map(text, sorted(topn, key=index) if len(topn) > 1 else topn)) for topn in topns]
+        topns = [list(map(text, topn)) for topn in topns]
 
         # Run qa pipeline and return answers
         return self.answers(names, questions, contexts, topns, snippets)
@@ -98,52 +130,74 @@ class Extractor(Pipeline):
 
         # Tokenize text
         segments, tokenlist = [], []
-        for text in texts:
-            tokens = self.tokenizer.tokenize(text)
+        for text, tokens in zip(texts, self.batchtokenize(texts)):
             if tokens:
                 segments.append(text)
                 tokenlist.append(tokens)
 
-        # Add index id to segments to preserver ordering after filters
-        segments = list(enumerate(segments))
-
         # Run batch queries for performance purposes
-        if isinstance(self.similarity, Similarity):
+        if self._pipelinesimilarity:
             # Get list of (id, score) - sorted by highest score per query
-            scores = self.similarity(queries, [t for _, t in segments])
+            scores = self.similarity(queries, segments)
         else:
-            # Assume this is an embeddings instance, tokenize and run similarity queries
-            scores = self.similarity.batchsimilarity([self.tokenizer.tokenize(x) for x in queries], tokenlist)
+            # Tokenize and run similarity queries against embeddings instance
+            scores = self.similarity.batchsimilarity(self.batchtokenize(queries), tokenlist)
+
+        # Add index id to segments to preserve ordering after filters
+        segments = list(enumerate(segments))
+
+        # Minimum score and token settings
+        minscore, mintokens = self.minscore, self.mintokens
 
         # Build question-context pairs
-        results = []
+        results, lowercase = [], None
         for i, query in enumerate(queries):
             # Get list of required and prohibited tokens
-            must = [token.strip("+") for token in query.split() if token.startswith("+") and len(token) > 1]
-            mnot = [token.strip("-") for token in query.split() if token.startswith("-") and len(token) > 1]
-
-            # List of matches
-            matches = []
-            for x, score in scores[i]:
-                # Get segment text
-                text = segments[x][1]
-
-                # Add result if:
-                #   - all required tokens are present or there are not required tokens AND
-                #   - all prohibited tokens are not present or there are not prohibited tokens
-                #   - score is above minimum score required
-                #   - number of tokens is above minimum number of tokens required
-                if (not must or all(token.lower() in text.lower() for token in must)) and (
-                    not mnot or all(token.lower() not in text.lower() for token in mnot)
-                ):
-                    if score >= self.minscore and len(tokenlist[x]) >= self.mintokens:
-                        matches.append(segments[x] + (score,))
-
-            # Add query matches sorted by highest score
-            results.append(matches)
+            tokens = query.split()
+            must = [token.strip("+").lower() for token in tokens if token.startswith("+") and len(token) > 1]
+            mnot = [token.strip("-").lower() for token in tokens if token.startswith("-") and len(token) > 1]
+
+            # Fast path when there are no token filters, only the minimum score check applies
+            if not must and not mnot and mintokens <= 0:
+                results.append([segments[x] + (score,) for x, score in scores[i] if score >= minscore])
+                continue
+
+            # Lowercase segment text once per call. Scores cover all segments, so the full list is always used.
+            if (must or mnot) and lowercase is None:
+                lowercase = [text.lower() for _, text in segments]
+
+            # Add result if:
+            #   - all required tokens are present or there are not required tokens AND
+            #   - all prohibited tokens are not present or there are not prohibited tokens
+            #   - score is above minimum score required
+            #   - number of tokens is above minimum number of tokens required
+            results.append(
+                [
+                    segments[x] + (score,)
+                    for x, score in scores[i]
+                    if score >= minscore
+                    and len(tokenlist[x]) >= mintokens
+                    and (not must or all(token in lowercase[x] for token in must))
+                    and (not mnot or not any(token in lowercase[x] for token in mnot))
+                ]
+            )
 
         return results
 
+    def batchtokenize(self, texts):
+        """
+        Tokenizes a list of text using the extractor tokenizer.
+
+        Args:
+            texts: list of text
+
+        Returns:
+            list of tokens per text
+        """
+
+        tokenize = self.tokenizer.tokenize
+        return [tokenize(text) for text in texts]
+
     def answers(self, names, questions, contexts, topns, snippets):
         """
         Executes QA pipeline and formats extracted answers.
@@ -159,20 +213,12 @@ class Extractor(Pipeline):
             list of (name, answer)
         """
 
-        results = []
-
         # Run qa pipeline
         answers = self.pipeline(questions, contexts)
 
-        # Extract and format answer
-        for x, answer in enumerate(answers):
-            # Resolve snippet if necessary
-            if answer and snippets[x]:
-                answer = self.snippet(topns[x], answer)
-
-            results.append((names[x], answer))
-
-        return results
+        # Extract and format answer, resolve snippet if necessary
+        snippet = self.snippet
+        return [(names[x], snippet(topns[x], answer) if answer and snippets[x] else answer) for x, answer in enumerate(answers)]
 
     def snippet(self, topn, answer):
         """
@@ -2,8 +2,15 @@
 Questions module
 """
 
+from inspect import signature
+
+from transformers import Pipeline
+
 from ..hfpipeline import HFPipeline
 
+# Pipeline batching is only available in newer versions of transformers
+BATCHING = "batch_size" in signature(Pipeline.__call__).parameters
+
 
 class Questions(HFPipeline):
     """
@@ -13,7 +20,7 @@ class Questions(HFPipeline):
     def __init__(self, path=None, quantize=False, gpu=True, model=None):
         super().__init__("question-answering", path, quantize, gpu, model)
 
-    def __call__(self, questions, contexts, workers=0):
+    def __call__(self, questions, contexts, workers=0, batch=64):
         """
         Runs a extractive question-answering model against each question-context pair, finding the best answers.
 
@@ -21,28 +28,30 @@ class Questions(HFPipeline):
             questions: list of questions
             contexts: list of contexts to pull answers from
             workers: number of concurrent workers to use for processing data, defaults to None
+            batch: number of question-context pairs to process per model forward pass, defaults to 64
 
         Returns:
             list of answers
         """
 
-        answers = []
+        answers = [None] * len(questions)
 
-        for x, question in enumerate(questions):
-            if question and contexts[x]:
-                # Run the QA pipeline
-                result = self.pipeline(question=question, context=contexts[x], num_workers=workers)
+        # Only run question-context pairs with content
+        indices = [x for x, question in enumerate(questions) if question and contexts[x]]
 
+        if indices:
+            # Run the QA pipeline with batched forward passes, if supported
+            kwargs = {"batch_size": batch} if BATCHING else {}
+            results = self.pipeline(question=[questions[x] for x in indices], context=[contexts[x] for x in indices], num_workers=workers, **kwargs)
+
+            # Pipeline returns a single result when there is only one input
+            results = [results] if isinstance(results, dict) else results
+
+            for x, result in zip(indices, results):
                 # Get answer and score
                 answer, score = result["answer"], result["score"]
 
                 # Require score to be at least 0.05
-                if score < 0.05:
-                    answer = None
-
-                # Add answer
-                answers.append(answer)
-            else:
-                answers.append(None)
+                answers[x] = answer if score >= 0.05 else None
 
         return answers
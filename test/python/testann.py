@@ -3,6 +3,8 @@ ANN module tests
 """
 
 import os
+import subprocess
+import sys
 import tempfile
 import unittest
 
@@ -61,6 +63,24 @@ class TestANN(unittest.TestCase):
         # Test with custom settings
         self.runTests("hnsw", {"hnsw": {"efconstruction": 100, "m": 4, "randomseed": 0, "efsearch": 5}})
 
+    def testLazyImport(self):
+        """
+        Test only the selected backend is imported
+        """
+
+        # Run in a separate process, other tests in this process load all backends
+        code = (
+            "import sys\n"
+            "import numpy as np\n"
+            "from txtai.ann import ANNFactory\n"
+            "model = ANNFactory.create({'backend': 'faiss', 'dimensions': 10})\n"
+            "model.index(np.random.rand(100, 10).astype(np.float32))\n"
+            "print(','.join(module for module in ('txtai.ann.annoy', 'txtai.ann.faiss', 'txtai.ann.hnsw') if module in sys.modules))\n"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True)
+        self.assertEqual(result.stdout.strip(), "txtai.ann.faiss")
+
     def testNotImplemented(self):
         """
         Tests exceptions for non-implemented methods
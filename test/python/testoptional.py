@@ -2,6 +2,7 @@
 Optional module tests
 """
 
+import importlib
 import sys
 import unittest
 
@@ -42,21 +43,21 @@ class TestOptional(unittest.TestCase):
         ]
 
         # Get handle to all currently loaded txtai modules
-        modules = modules + [key for key in sys.modules if key.startswith("txtai")]
-        cls.modules = {module: None for module in modules}
+        modules = set(modules) | {key for key in list(sys.modules) if key.startswith("txtai")}
 
-        # Replace loaded modules with stubs. Save modules for later reloading
-        for module in cls.modules:
-            if module in sys.modules:
-                cls.modules[module] = sys.modules[module]
+        # Save modules for later reloading
+        cls.modules = {module: sys.modules.get(module) for module in modules}
 
+        # Replace loaded modules with stubs
+        for module in cls.modules:
             # Remove txtai modules. Set optional dependencies to None to prevent reloading.
             if "txtai" in module:
-                if module in sys.modules:
-                    del sys.modules[module]
+                sys.modules.pop(module, None)
             else:
                 sys.modules[module] = None
 
+        importlib.invalidate_caches()
+
     @classmethod
     def tearDownClass(cls):
         """
@@ -70,6 +71,8 @@ class TestOptional(unittest.TestCase):
             else:
                 del sys.modules[key]
 
+        importlib.invalidate_caches()
+
     def testApi(self):
         """
         Test missing api dependencies
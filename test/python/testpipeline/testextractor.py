@@ -90,6 +90,21 @@ class TestExtractor(unittest.TestCase):
         answers = self.extractor([(question, question, question, False)], self.data)
         self.assertIsNone(answers[0][1])
 
+    def testQuestions(self):
+        """
+        Test batch qa with empty questions and contexts
+        """
+
+        questions = ["What team won the game?", "", "What was the score?", "What hockey team won?"]
+        contexts = ["Blue Jays beat Red Sox final score 2-1", "Flyers win 4-1", "", "Flyers win 4-1"]
+
+        answers = self.extractor.pipeline(questions, contexts)
+        self.assertEqual(answers, ["Blue Jays", None, None, "Flyers"])
+
+        # Single question batch
+        answers = self.extractor.pipeline(["What hockey team won?"], ["Flyers win 4-1"])
+        self.assertEqual(answers, ["Flyers"])
+
     @unittest.skipIf(platform.system() == "Darwin", "Quantized models not supported on macOS")
     def testQuantize(self):
         """
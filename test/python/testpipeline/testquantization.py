@@ -5,6 +5,8 @@ Quantization module tests
 import platform
 import unittest
 
+from unittest.mock import MagicMock, patch
+
 from transformers import AutoModel
 
 from txtai.pipeline import HFModel, HFPipeline
@@ -33,3 +35,108 @@ class TestQuantization(unittest.TestCase):
 
         pipeline = HFPipeline("text-classification", "google/bert_uncased_L-2_H-128_A-2", True, False)
         self.assertIsNotNone(pipeline)
+
+    @patch("txtai.pipeline.hfpipeline.pipeline")
+    def testPipelineBoolean(self, pipeline):
+        """
+        Tests boolean quantization flags through HFPipeline.
+        """
+
+        with patch.object(HFPipeline, "quantize") as quantize:
+            HFPipeline("text-classification", "google/bert_uncased_L-2_H-128_A-2", True, False)
+            quantize.assert_called_once()
+            self.assertNotIn("model_kwargs", pipeline.call_args.kwargs)
+
+        with patch.object(HFPipeline, "quantize") as quantize:
+            HFPipeline("text-classification", "google/bert_uncased_L-2_H-128_A-2", False, False)
+            quantize.assert_not_called()
+
+    @unittest.skipIf(platform.system() == "Darwin", "Quantized models not supported on macOS")
+    def testPipelineOptions(self):
+        """
+        Tests quantization options fall back to dynamic quantization on CPU through HFPipeline.
+        """
+
+        options = {"load_in_8bit": True, "llm_int8_threshold": 6.0}
+
+        pipeline = HFPipeline("text-classification", "google/bert_uncased_L-2_H-128_A-2", options, False)
+        self.assertTrue(self.quantized(pipeline.pipeline.model))
+
+        # Task not loaded by Models.load
+        path = "google/bert_uncased_L-2_H-128_A-2"
+        pipeline = HFPipeline("token-classification", (path, path), options, False)
+        self.assertTrue(self.quantized(pipeline.pipeline.model))
+
+    @patch("txtai.pipeline.hfpipeline.Models.deviceid", return_value=0)
+    @patch("txtai.pipeline.hfpipeline.pipeline")
+    def testPipelineOptionsGPU(self, pipeline, _):
+        """
+        Tests quantization options are passed as a BitsAndBytesConfig to the model load method on GPU.
+        """
+
+        path = "google/bert_uncased_L-2_H-128_A-2"
+        options = {"load_in_8bit": True, "llm_int8_threshold": 6.0}
+
+        with patch.object(HFPipeline, "quantize") as quantize:
+            # Model loaded by pipeline
+            HFPipeline("text-classification", path, options)
+            self.assertOptions(pipeline.call_args.kwargs["model_kwargs"], 0)
+            self.assertIsNone(pipeline.call_args.kwargs["device"])
+
+            # Task not loaded by Models.load, model loaded by pipeline
+            HFPipeline("token-classification", (path, path), options)
+            self.assertEqual(pipeline.call_args.kwargs["model"], path)
+            self.assertOptions(pipeline.call_args.kwargs["model_kwargs"], 0)
+
+            # Model loaded by Models.load
+            with patch("txtai.models.models.AutoModelForQuestionAnswering") as automodel:
+                HFPipeline("question-answering", (path, path), options)
+                self.assertOptions(automodel.from_pretrained.call_args.kwargs, 0)
+                self.assertNotIn("model_kwargs", pipeline.call_args.kwargs)
+
+            # Already loaded models can't take quantization options
+            with self.assertRaises(ValueError):
+                HFPipeline("text-classification", (MagicMock(), path), options)
+
+            quantize.assert_not_called()
+
+    @patch("txtai.pipeline.hfpipeline.pipeline")
+    def testPipelineOptionsModel(self, pipeline):
+        """
+        Tests quantization options fall back to dynamic quantization for already loaded models on CPU.
+        """
+
+        model = MagicMock()
+
+        with patch.object(HFPipeline, "quantize") as quantize:
+            HFPipeline("text-classification", (model, "google/bert_uncased_L-2_H-128_A-2"), {"load_in_8bit": True}, False)
+            quantize.assert_called_once()
+            self.assertEqual(pipeline.call_args.kwargs["model"], model)
+            self.assertNotIn("model_kwargs", pipeline.call_args.kwargs)
+
+    def assertOptions(self, kwargs, deviceid):
+        """
+        Asserts quantization options are set in model load arguments.
+
+        Args:
+            kwargs: model load arguments
+            deviceid: expected device id
+        """
+
+        config = kwargs["quantization_config"]
+        self.assertTrue(config.load_in_8bit)
+        self.assertEqual(config.llm_int8_threshold, 6.0)
+        self.assertEqual(kwargs["device_map"], {"": deviceid})
+
+    def quantized(self, model):
+        """
+        Checks if a model has dynamically quantized layers.
+
+        Args:
+            model: torch model
+
+        Returns:
+            True if model has quantized layers
+        """
+
+        return any("quantized" in type(module).__module__ for module in model.modules())